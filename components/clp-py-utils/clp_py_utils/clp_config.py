@@ -168,6 +168,7 @@ class QueryScheduler(BaseModel):
     port = 7000
     jobs_poll_delay: float = 0.1  # seconds
     num_archives_to_search_per_sub_job: int = 16
+    num_archives_per_search_task: int = 4
     logging_level: str = "INFO"
 
     @validator("logging_level")
@@ -105,8 +105,8 @@ def main(argv):
                     `duration` FLOAT NULL DEFAULT NULL,
                     `job_config` VARBINARY(60000) NOT NULL,
                     PRIMARY KEY (`id`) USING BTREE,
-                    INDEX `JOB_STATUS` (`status`) USING BTREE
-                ) ROW_FORMAT=DYNAMIC
+                    INDEX `JOB_STATUS` (`status`, `id`) USING BTREE
+                ) ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
                 """
             )
 
@@ -5,7 +5,7 @@ import subprocess
 import sys
 from contextlib import closing
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from celery.app.task import Task
 from celery.utils.log import get_task_logger
@@ -108,34 +108,21 @@ def make_command(
     return command
 
 
-@app.task(bind=True)
-def search(
-    self: Task,
+def search_archive(
     job_id: str,
     task_id: int,
-    search_config_obj: dict,
     archive_id: str,
-    clp_metadata_db_conn_params: dict,
+    search_config: SearchConfig,
+    sql_adapter: SQL_Adapter,
     results_cache_uri: str,
-) -> Dict[str, Any]:
-    clp_home = Path(os.getenv("CLP_HOME"))
-    archive_directory = Path(os.getenv("CLP_ARCHIVE_OUTPUT_DIR"))
-    clp_logs_dir = Path(os.getenv("CLP_LOGS_DIR"))
-    clp_logging_level = str(os.getenv("CLP_LOGGING_LEVEL"))
-    clp_storage_engine = str(os.getenv("CLP_STORAGE_ENGINE"))
-
-    # Setup logging to file
-    worker_logs_dir = clp_logs_dir / job_id
-    worker_logs_dir.mkdir(exist_ok=True, parents=True)
-    set_logging_level(logger, clp_logging_level)
+    clp_home: Path,
+    archive_directory: Path,
+    clp_storage_engine: str,
+    worker_logs_dir: Path,
+) -> QueryTaskResult:
     clo_log_path = worker_logs_dir / f"{task_id}-clo.log"
     clo_log_file = open(clo_log_path, "w")
 
-    logger.info(f"Started task for job {job_id}")
-
-    search_config = SearchConfig.parse_obj(search_config_obj)
-    sql_adapter = SQL_Adapter(Database.parse_obj(clp_metadata_db_conn_params))
-
     start_time = datetime.datetime.now()
     search_status = QueryTaskStatus.RUNNING
     with closing(sql_adapter.create_connection(True)) as db_conn, closing(
@@ -169,7 +156,7 @@ def search(
                 status=QueryTaskStatus.FAILED,
                 duration=0,
                 error_log_path=clo_log_path,
-            ).dict()
+            )
 
         update_search_task_metadata(
             db_cursor, task_id, dict(status=search_status, start_time=start_time)
@@ -233,4 +220,60 @@ def search(
     if QueryTaskStatus.FAILED == search_status:
         search_task_result.error_log_path = clo_log_path
 
-    return search_task_result.dict()
+    return search_task_result
+
+
+@app.task(bind=True)
+def search(
+    self: Task,
+    job_id: str,
+    task_ids: List[int],
+    search_config_obj: dict,
+    archive_ids: List[str],
+    clp_metadata_db_conn_params: dict,
+    results_cache_uri: str,
+) -> List[Dict[str, Any]]:
+    """
+    Searches each of the given archives in turn. Bundling multiple archives into one task keeps the
+    number of broker messages and result-backend entries proportional to the number of bundles
+    rather than the number of archives.
+    :param self:
+    :param job_id:
+    :param task_ids:
+    :param search_config_obj:
+    :param archive_ids: The archives to search, paired element-wise with `task_ids`.
+    :param clp_metadata_db_conn_params:
+    :param results_cache_uri:
+    :return: One serialized QueryTaskResult per archive searched.
+    """
+    clp_home = Path(os.getenv("CLP_HOME"))
+    archive_directory = Path(os.getenv("CLP_ARCHIVE_OUTPUT_DIR"))
+    clp_logs_dir = Path(os.getenv("CLP_LOGS_DIR"))
+    clp_logging_level = str(os.getenv("CLP_LOGGING_LEVEL"))
+    clp_storage_engine = str(os.getenv("CLP_STORAGE_ENGINE"))
+
+    # Setup logging to file
+    worker_logs_dir = clp_logs_dir / job_id
+    worker_logs_dir.mkdir(exist_ok=True, parents=True)
+    set_logging_level(logger, clp_logging_level)
+
+    logger.info(f"Started task for job {job_id} with {len(archive_ids)} archive(s)")
+
+    search_config = SearchConfig.parse_obj(search_config_obj)
+    sql_adapter = SQL_Adapter(Database.parse_obj(clp_metadata_db_conn_params))
+
+    return [
+        search_archive(
+            job_id,
+            task_id,
+            archive_id,
+            search_config,
+            sql_adapter,
+            results_cache_uri,
+            clp_home,
+            archive_directory,
+            clp_storage_engine,
+            worker_logs_dir,
+        ).dict()
+        for task_id, archive_id in zip(task_ids, archive_ids)
+    ]
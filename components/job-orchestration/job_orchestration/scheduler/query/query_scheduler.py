@@ -19,12 +19,13 @@ import argparse
 import asyncio
 import contextlib
 import datetime
+import itertools
 import logging
 import os
 import pathlib
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import celery
 import msgpack
@@ -38,7 +39,7 @@ from clp_py_utils.clp_config import (
 from clp_py_utils.clp_logging import get_logger, get_logging_formatter, set_logging_level
 from clp_py_utils.core import read_yaml_config_file
 from clp_py_utils.decorators import exception_default_value
-from clp_py_utils.sql_adapter import SQL_Adapter
+from clp_py_utils.sql_adapter import DummyCloseableObject, SQL_Adapter
 from job_orchestration.executor.query.fs_search_task import search
 from job_orchestration.scheduler.constants import QueryJobStatus, QueryTaskStatus
 from job_orchestration.scheduler.job_config import SearchConfig
@@ -48,7 +49,12 @@ from job_orchestration.scheduler.query.reducer_handler import (
     ReducerHandlerMessageQueues,
     ReducerHandlerMessageType,
 )
-from job_orchestration.scheduler.scheduler_data import InternalJobState, QueryTaskResult, SearchJob
+from job_orchestration.scheduler.scheduler_data import (
+    InternalJobState,
+    JobStatusUpdate,
+    QueryTaskResult,
+    SearchJob,
+)
 from pydantic import ValidationError
 
 # Setup logging
@@ -57,8 +63,36 @@ logger = get_logger("search-job-handler")
 # Dictionary of active jobs indexed by job id
 active_jobs: Dict[str, SearchJob] = {}
 
+# Bounds how many PENDING jobs a single poll claims so one scheduler instance doesn't lock up the
+# whole backlog when several instances share the jobs table
+MAX_PENDING_JOBS_PER_POLL = 64
+
+# Queue of (job ID, results, exception) tuples for jobs whose current sub-job has completed,
+# populated by the per-job awaiter tasks. Draining this queue costs work proportional to the number
+# of completions rather than the number of active jobs, and avoids asking the result backend
+# whether each job is ready (a round-trip per job per poll).
+sub_job_completion_queue: Optional[asyncio.Queue] = None
+
 reducer_connection_queue: Optional[asyncio.Queue] = None
 
+# Event set whenever a job becomes ready for dispatch so the job-handling loop can wake up
+# immediately instead of waiting out its full poll delay
+dispatch_wakeup_event: Optional[asyncio.Event] = None
+
+
+async def wait_for_dispatch_wakeup(jobs_poll_delay: float):
+    """
+    Waits until `dispatch_wakeup_event` is set, or until `jobs_poll_delay` seconds have elapsed.
+    The timeout bounds how long newly submitted jobs (which are only visible via the database) can
+    wait before being fetched.
+    :param jobs_poll_delay:
+    """
+    try:
+        await asyncio.wait_for(dispatch_wakeup_event.wait(), timeout=jobs_poll_delay)
+    except asyncio.TimeoutError:
+        pass
+    dispatch_wakeup_event.clear()
+
 
 def cancel_job_except_reducer(job: SearchJob):
     """
@@ -91,47 +125,96 @@ async def release_reducer_for_job(job: SearchJob):
 
 
 @exception_default_value(default=[])
-def fetch_new_search_jobs(db_conn) -> list:
+def fetch_cancelling_search_jobs(db_cursor) -> list:
     """
-    Fetches search jobs with status=PENDING from the database.
-    :param db_conn:
-    :return: The pending search jobs on success. An empty list if an exception occurs while
-    interacting with the database.
+    Fetches the IDs of search jobs with status=CANCELLING from the database. Only columns covered
+    by the (status, id) index are selected, keeping the poll an index-only read.
+    :param db_cursor:
+    :return: The cancelling jobs on success. An empty list if an exception occurs while interacting
+    with the database.
     """
-    with contextlib.closing(db_conn.cursor(dictionary=True)) as db_cursor:
-        db_cursor.execute(
-            f"""
-            SELECT {QUERY_JOBS_TABLE_NAME}.id as job_id,
-            {QUERY_JOBS_TABLE_NAME}.job_config
-            FROM {QUERY_JOBS_TABLE_NAME}
-            WHERE {QUERY_JOBS_TABLE_NAME}.status={QueryJobStatus.PENDING}
-            """
-        )
-        return db_cursor.fetchall()
+    db_cursor.execute(
+        f"""
+        SELECT {QUERY_JOBS_TABLE_NAME}.id as job_id
+        FROM {QUERY_JOBS_TABLE_NAME}
+        WHERE {QUERY_JOBS_TABLE_NAME}.status = {QueryJobStatus.CANCELLING}
+        """
+    )
+    return db_cursor.fetchall()
 
 
 @exception_default_value(default=[])
-def fetch_cancelling_search_jobs(db_conn) -> list:
+def claim_pending_search_jobs(db_conn, db_cursor, limit: int) -> list:
     """
-    Fetches search jobs with status=CANCELLING from the database.
+    Claims up to `limit` PENDING search jobs by locking their rows with SKIP LOCKED and setting
+    their status to RUNNING within a single short transaction. Rows locked by another transaction
+    are skipped rather than waited on, so multiple scheduler instances can drain the pending
+    backlog cooperatively without dispatching the same job twice.
     :param db_conn:
-    :return: The cancelling search jobs on success. An empty list if an exception occurs while
-    interacting with the database.
+    :param db_cursor:
+    :param limit:
+    :return: The claimed jobs' IDs and configs on success. An empty list if an exception occurs
+    while interacting with the database.
     """
-    with contextlib.closing(db_conn.cursor(dictionary=True)) as db_cursor:
-        db_cursor.execute(
-            f"""
-            SELECT {QUERY_JOBS_TABLE_NAME}.id as job_id
-            FROM {QUERY_JOBS_TABLE_NAME}
-            WHERE {QUERY_JOBS_TABLE_NAME}.status={QueryJobStatus.CANCELLING}
-            """
-        )
-        return db_cursor.fetchall()
+    db_cursor.execute(
+        f"""
+        SELECT {QUERY_JOBS_TABLE_NAME}.id as job_id,
+        {QUERY_JOBS_TABLE_NAME}.job_config
+        FROM {QUERY_JOBS_TABLE_NAME}
+        WHERE {QUERY_JOBS_TABLE_NAME}.status = {QueryJobStatus.PENDING}
+        ORDER BY {QUERY_JOBS_TABLE_NAME}.id
+        LIMIT {limit}
+        FOR UPDATE SKIP LOCKED
+        """
+    )
+    claimed_jobs = db_cursor.fetchall()
+    if 0 == len(claimed_jobs):
+        db_conn.commit()
+        return []
+
+    placeholders = ", ".join(["%s"] * len(claimed_jobs))
+    db_cursor.execute(
+        f"UPDATE {QUERY_JOBS_TABLE_NAME} SET status=%s WHERE id IN ({placeholders})",
+        (int(QueryJobStatus.RUNNING), *[job["job_id"] for job in claimed_jobs]),
+    )
+    db_conn.commit()
+    return claimed_jobs
+
+
+@exception_default_value(default=False)
+def reset_unstarted_running_jobs(db_conn, db_cursor) -> bool:
+    """
+    Resets jobs that were claimed (set to RUNNING) but never dispatched back to PENDING so they're
+    re-claimed on the next poll. Only rows without a start_time qualify since dispatch is what
+    assigns it. Run at startup, this recovers jobs stranded by a scheduler that crashed (or was
+    stopped) between claiming and dispatching.
+    NOTE: With multiple scheduler instances, an instance starting up could reset a job another
+    live instance had just claimed, causing a double dispatch. A heartbeat-based sweeper is needed
+    before running more than one instance.
+    :param db_conn:
+    :param db_cursor:
+    :return: True on success, False if an exception occurs while interacting with the database.
+    """
+    db_cursor.execute(
+        f"UPDATE {QUERY_JOBS_TABLE_NAME} SET status={QueryJobStatus.PENDING}"
+        f" WHERE status={QueryJobStatus.RUNNING} AND start_time IS NULL"
+    )
+    db_conn.commit()
+    if db_cursor.rowcount > 0:
+        logger.info(f"Reset {db_cursor.rowcount} claimed-but-undispatched jobs to PENDING.")
+    return True
+
+
+# Cache of UPDATE statement text keyed by (table name, field names, whether the update is
+# conditional on the previous status). Updates with the same shape reuse the same statement text so
+# the server can reuse its parse/plan for the statement.
+_update_statement_cache: Dict[Tuple[str, Tuple[str, ...], bool], str] = {}
 
 
 @exception_default_value(default=False)
 def set_job_or_task_status(
     db_conn,
+    db_cursor,
     table_name: str,
     job_id: str,
     status: QueryJobStatus | QueryTaskStatus,
@@ -141,8 +224,10 @@ def set_job_or_task_status(
     """
     Sets the status of the job or the tasks identified by `job_id` to `status`. If `prev_status` is
     specified, the update is conditional on the job/task's current status matching `prev_status`. If
-    `kwargs` are specified, the fields identified by the args are also updated.
+    `kwargs` are specified, the fields identified by the args are also updated. All values are
+    passed as query parameters rather than being formatted into the statement text.
     :param db_conn:
+    :param db_cursor:
     :param table_name:
     :param job_id:
     :param status:
@@ -151,96 +236,204 @@ def set_job_or_task_status(
     :return: True on success, False if the update fails or an exception occurs while interacting
     with the database.
     """
-    field_set_expressions = [f"status={status}"]
-    if QUERY_JOBS_TABLE_NAME == table_name:
-        id_col_name = "id"
-        field_set_expressions.extend([f'{k}="{v}"' for k, v in kwargs.items()])
-    elif QUERY_TASKS_TABLE_NAME == table_name:
-        id_col_name = "job_id"
-        field_set_expressions.extend([f"{k}={v}" for k, v in kwargs.items()])
-    else:
-        raise ValueError(f"Unsupported table name {table_name}")
+    field_names = tuple(kwargs.keys())
+    cache_key = (table_name, field_names, prev_status is not None)
+    update = _update_statement_cache.get(cache_key)
+    if update is None:
+        if QUERY_JOBS_TABLE_NAME == table_name:
+            id_col_name = "id"
+        elif QUERY_TASKS_TABLE_NAME == table_name:
+            id_col_name = "job_id"
+        else:
+            raise ValueError(f"Unsupported table name {table_name}")
+        field_set_expressions = ["status=%s"]
+        field_set_expressions.extend([f"{field_name}=%s" for field_name in field_names])
+        update = (
+            f'UPDATE {table_name} SET {", ".join(field_set_expressions)} WHERE {id_col_name}=%s'
+        )
+        if prev_status is not None:
+            update += " AND status=%s"
+        _update_statement_cache[cache_key] = update
+
+    params = [int(status), *kwargs.values(), job_id]
+    if prev_status is not None:
+        params.append(int(prev_status))
+
+    db_cursor.execute(update, tuple(params))
+    db_conn.commit()
+    return db_cursor.rowcount != 0
+
+
+@exception_default_value(default=False)
+def set_task_statuses_cancelled(db_conn, db_cursor, job_id: str) -> bool:
+    """
+    Sets the status of the job's PENDING and RUNNING tasks to CANCELLED, computing the duration of
+    RUNNING tasks server-side from their start time.
+    :param db_conn:
+    :param db_cursor:
+    :param job_id:
+    :return: True on success, False if an exception occurs while interacting with the database.
+    """
+    # NOTE: `duration` must be assigned before `status` since MySQL evaluates SET clauses
+    # left-to-right and `duration`'s CASE expression must see the task's original status.
     update = (
-        f'UPDATE {table_name} SET {", ".join(field_set_expressions)} WHERE {id_col_name}={job_id}'
+        f"UPDATE {QUERY_TASKS_TABLE_NAME}"
+        f" SET duration=CASE status WHEN {QueryTaskStatus.RUNNING}"
+        f" THEN TIMESTAMPDIFF(MICROSECOND, start_time, NOW())/1000000.0 ELSE 0 END,"
+        f" status=%s"
+        f" WHERE job_id=%s"
+        f" AND status IN ({QueryTaskStatus.PENDING}, {QueryTaskStatus.RUNNING})"
     )
+    db_cursor.execute(update, (int(QueryTaskStatus.CANCELLED), job_id))
+    db_conn.commit()
+    return True
 
-    if prev_status is not None:
-        update += f" AND status={prev_status}"
+
+@exception_default_value(default=-1)
+def set_job_statuses_bulk(db_conn, updates: List[JobStatusUpdate]) -> int:
+    """
+    Sets the statuses of several jobs with a single UPDATE statement and a single commit, using
+    `CASE id WHEN ...` expressions to assign per-job values. This avoids one round-trip and commit
+    per job when multiple jobs finish within the same poll.
+    :param db_conn:
+    :param updates:
+    :return: The number of job rows updated; fewer than `len(updates)` means some jobs failed
+    their previous-status guard (e.g., they were cancelled concurrently). -1 if an exception
+    occurs while interacting with the database.
+    """
+    if 0 == len(updates):
+        return 0
+
+    field_names = set()
+    for update in updates:
+        field_names.update(update.fields.keys())
+
+    params: List[any] = []
+
+    status_cases = " ".join("WHEN %s THEN %s" for _ in updates)
+    for update in updates:
+        params.extend((update.job_id, int(update.status)))
+    field_set_expressions = [f"status=CASE id {status_cases} END"]
+
+    for field_name in sorted(field_names):
+        field_cases = []
+        for update in updates:
+            if field_name in update.fields:
+                field_cases.append("WHEN %s THEN %s")
+                params.extend((update.job_id, update.fields[field_name]))
+        # Leave the field unchanged for jobs that don't set it
+        field_set_expressions.append(
+            f'{field_name}=CASE id {" ".join(field_cases)} ELSE {field_name} END'
+        )
+
+    id_clauses = []
+    for update in updates:
+        if update.prev_status is not None:
+            id_clauses.append("(id=%s AND status=%s)")
+            params.extend((update.job_id, int(update.prev_status)))
+        else:
+            id_clauses.append("id=%s")
+            params.append(update.job_id)
+
+    statement = (
+        f'UPDATE {QUERY_JOBS_TABLE_NAME} SET {", ".join(field_set_expressions)}'
+        f' WHERE {" OR ".join(id_clauses)}'
+    )
 
     with contextlib.closing(db_conn.cursor()) as cursor:
-        cursor.execute(update)
+        cursor.execute(statement, tuple(params))
         db_conn.commit()
-        rval = cursor.rowcount != 0
-    return rval
+        num_updated = cursor.rowcount
+    return num_updated
 
 
-async def handle_cancelling_search_jobs(db_conn_pool) -> None:
+async def handle_cancelling_search_jobs(
+    db_conn, db_cursor, cancelling_jobs: List[Dict[str, any]]
+) -> None:
     global active_jobs
 
-    with contextlib.closing(db_conn_pool.connect()) as db_conn:
-        cancelling_jobs = fetch_cancelling_search_jobs(db_conn)
-
-        for cancelling_job in cancelling_jobs:
-            job_id = str(cancelling_job["job_id"])
-            if job_id in active_jobs:
-                job = active_jobs.pop(job_id)
-                cancel_job_except_reducer(job)
-                # Perform any async tasks last so that it's easier to reason about synchronization
-                # issues between concurrent tasks
-                await release_reducer_for_job(job)
-            else:
-                continue
+    job_status_updates: List[JobStatusUpdate] = []
+    for cancelling_job in cancelling_jobs:
+        job_id = str(cancelling_job["job_id"])
+        if job_id in active_jobs:
+            job = active_jobs.pop(job_id)
+            cancel_job_except_reducer(job)
+            # Perform any async tasks last so that it's easier to reason about synchronization
+            # issues between concurrent tasks
+            await release_reducer_for_job(job)
+        else:
+            continue
 
-            set_job_or_task_status(
-                db_conn,
-                QUERY_TASKS_TABLE_NAME,
-                job_id,
-                QueryTaskStatus.CANCELLED,
-                QueryTaskStatus.PENDING,
-                duration=0,
-            )
+        set_task_statuses_cancelled(db_conn, db_cursor, job_id)
 
-            set_job_or_task_status(
-                db_conn,
-                QUERY_TASKS_TABLE_NAME,
-                job_id,
-                QueryTaskStatus.CANCELLED,
-                QueryTaskStatus.RUNNING,
-                duration="TIMESTAMPDIFF(MICROSECOND, start_time, NOW())/1000000.0",
+        job_status_updates.append(
+            JobStatusUpdate(
+                job_id=job_id,
+                status=QueryJobStatus.CANCELLED,
+                prev_status=QueryJobStatus.CANCELLING,
+                fields={"duration": (datetime.datetime.now() - job.start_time).total_seconds()},
             )
+        )
 
-            if set_job_or_task_status(
-                db_conn,
-                QUERY_JOBS_TABLE_NAME,
-                job_id,
-                QueryJobStatus.CANCELLED,
-                QueryJobStatus.CANCELLING,
-                duration=(datetime.datetime.now() - job.start_time).total_seconds(),
-            ):
-                logger.info(f"Cancelled job {job_id}.")
-            else:
-                logger.error(f"Failed to cancel job {job_id}.")
+    num_updated = set_job_statuses_bulk(db_conn, job_status_updates)
+    if num_updated < 0:
+        for job_status_update in job_status_updates:
+            logger.error(f"Failed to cancel job {job_status_update.job_id}.")
+    else:
+        for job_status_update in job_status_updates:
+            logger.info(f"Cancelled job {job_status_update.job_id}.")
+        if num_updated != len(job_status_updates):
+            # The batched statement can't tell us which rows were left unchanged
+            job_ids = [job_status_update.job_id for job_status_update in job_status_updates]
+            logger.warning(
+                f"Only {num_updated} of {len(job_status_updates)} cancelled jobs ({job_ids}) had"
+                f" their status updated; the rest likely changed status concurrently."
+            )
 
 
-def insert_search_tasks_into_db(db_conn, job_id, archive_ids: List[str]) -> List[int]:
-    task_ids = []
-    with contextlib.closing(db_conn.cursor()) as cursor:
-        for archive_id in archive_ids:
-            cursor.execute(
-                f"""
-                INSERT INTO {QUERY_TASKS_TABLE_NAME}
-                (job_id, archive_id)
-                VALUES({job_id}, '{archive_id}')
-                """
-            )
-            task_ids.append(cursor.lastrowid)
+def insert_search_tasks_into_db(db_conn, db_cursor, job_id, archive_ids: List[str]) -> List[int]:
+    """
+    Inserts one task row per archive with a single batched INSERT and reads back the inserted
+    rows' IDs.
+    NOTE: The IDs are read back explicitly because `lastrowid` after `executemany` is
+    connector-specific — mysql-connector rewrites the batch into one multi-row statement and
+    reports the first generated ID, while MariaDB Connector/Python uses the bulk-execute protocol,
+    which doesn't guarantee which row's ID is reported.
+    :param db_conn:
+    :param db_cursor:
+    :param job_id:
+    :param archive_ids:
+    :return: The inserted tasks' IDs, in `archive_ids` order.
+    """
+    db_cursor.executemany(
+        f"INSERT INTO {QUERY_TASKS_TABLE_NAME} (job_id, archive_id) VALUES (%s, %s)",
+        [(job_id, archive_id) for archive_id in archive_ids],
+    )
+    # The rows just inserted are the job's highest task IDs, assigned in insertion (i.e.,
+    # `archive_ids`) order
+    db_cursor.execute(
+        f"SELECT id FROM {QUERY_TASKS_TABLE_NAME} WHERE job_id=%s"
+        f" ORDER BY id DESC LIMIT {len(archive_ids)}",
+        (job_id,),
+    )
+    task_ids = sorted(row["id"] for row in db_cursor.fetchall())
     db_conn.commit()
     return task_ids
 
 
+def parse_search_config(job_config: bytes) -> SearchConfig:
+    """
+    Decodes and validates a job's msgpacked search config. This can take a while for large configs,
+    so callers on the event loop should run it in an executor.
+    :param job_config:
+    :return: The parsed config.
+    """
+    return SearchConfig.parse_obj(msgpack.unpackb(job_config))
+
+
 @exception_default_value(default=[])
 def get_archives_for_search(
-    db_conn,
+    db_cursor,
     search_config: SearchConfig,
 ):
     query = f"""SELECT id as archive_id, end_timestamp 
@@ -261,58 +454,92 @@ def get_archives_for_search(
         query += " WHERE " + " AND ".join(filter_clauses)
     query += " ORDER BY end_timestamp DESC"
 
-    with contextlib.closing(db_conn.cursor(dictionary=True)) as cursor:
-        if search_config.tags is not None:
-            cursor.execute(query, tuple(search_config.tags))
-        else:
-            cursor.execute(query)
-        archives_for_search = list(cursor.fetchall())
-    return archives_for_search
+    if search_config.tags is not None:
+        db_cursor.execute(query, tuple(search_config.tags))
+    else:
+        db_cursor.execute(query)
+    return list(db_cursor.fetchall())
 
 
 def get_task_group_for_job(
     archive_ids: List[str],
     task_ids: List[int],
     job_id: str,
-    search_config: SearchConfig,
+    search_config_obj: Dict[str, any],
     clp_metadata_db_conn_params: Dict[str, any],
     results_cache_uri: str,
+    num_archives_per_search_task: int,
 ):
-    search_config_obj = search_config.dict()
+    # Bundle `num_archives_per_search_task` archives into each task so the number of broker
+    # messages and result-backend entries scales with the number of bundles rather than the number
+    # of archives
     return celery.group(
         search.s(
             job_id=job_id,
-            archive_id=archive_ids[i],
-            task_id=task_ids[i],
+            archive_ids=archive_ids[i : i + num_archives_per_search_task],
+            task_ids=task_ids[i : i + num_archives_per_search_task],
             search_config_obj=search_config_obj,
             clp_metadata_db_conn_params=clp_metadata_db_conn_params,
             results_cache_uri=results_cache_uri,
         )
-        for i in range(len(archive_ids))
+        for i in range(0, len(archive_ids), num_archives_per_search_task)
     )
 
 
-def dispatch_search_job(
+async def dispatch_search_job(
     db_conn,
+    db_cursor,
     job: SearchJob,
     archives_for_search: List[Dict[str, any]],
     clp_metadata_db_conn_params: Dict[str, any],
     results_cache_uri: str,
+    num_archives_per_search_task: int,
 ) -> None:
     global active_jobs
     archive_ids = [archive["archive_id"] for archive in archives_for_search]
-    task_ids = insert_search_tasks_into_db(db_conn, job.id, archive_ids)
+    task_ids = insert_search_tasks_into_db(db_conn, db_cursor, job.id, archive_ids)
+
+    # Serialize the search config once per job rather than once per sub-job; by the first dispatch
+    # the config is final (any reducer has already been assigned)
+    if job.cached_search_config_obj is None:
+        job.cached_search_config_obj = job.search_config.dict()
 
     task_group = get_task_group_for_job(
         archive_ids,
         task_ids,
         job.id,
-        job.search_config,
+        job.cached_search_config_obj,
         clp_metadata_db_conn_params,
         results_cache_uri,
+        num_archives_per_search_task,
+    )
+    # `apply_async` serializes every task in the group and publishes them to the broker with
+    # blocking I/O, so run it in an executor to avoid stalling the event loop (and thus reducer
+    # connection handling) while large jobs are dispatched.
+    job.current_sub_job_async_task_result = await asyncio.get_running_loop().run_in_executor(
+        None, task_group.apply_async
     )
-    job.current_sub_job_async_task_result = task_group.apply_async()
     job.state = InternalJobState.RUNNING
+    job.current_sub_job_awaiter_task = asyncio.create_task(
+        await_sub_job_completion(job.id, job.current_sub_job_async_task_result)
+    )
+
+
+async def await_sub_job_completion(job_id: str, async_task_result) -> None:
+    """
+    Collects (in an executor, off the event loop) the results of the given sub-job's task group,
+    then queues them for a status check. `join_native` streams the group's results from the result
+    backend in a single call rather than one `ready()`/`get()` round-trip pair per task.
+    :param job_id:
+    :param async_task_result:
+    """
+    try:
+        returned_results = await asyncio.get_running_loop().run_in_executor(
+            None, async_task_result.join_native
+        )
+        sub_job_completion_queue.put_nowait((job_id, returned_results, None))
+    except Exception as e:
+        sub_job_completion_queue.put_nowait((job_id, None, e))
 
 
 async def acquire_reducer_for_job(job: SearchJob):
@@ -360,11 +587,14 @@ async def acquire_reducer_for_job(job: SearchJob):
     logger.info(f"Got reducer for job {job.id} at {reducer_host}:{reducer_port}")
 
 
-def handle_pending_search_jobs(
-    db_conn_pool,
+async def handle_pending_search_jobs(
+    db_conn,
+    db_cursor,
+    new_jobs: List[Dict[str, any]],
     clp_metadata_db_conn_params: Dict[str, any],
     results_cache_uri: str,
     num_archives_to_search_per_sub_job: int,
+    num_archives_per_search_task: int,
 ) -> List[asyncio.Task]:
     global active_jobs
 
@@ -374,94 +604,109 @@ def handle_pending_search_jobs(
         job for job in active_jobs.values() if InternalJobState.WAITING_FOR_DISPATCH == job.state
     ]
 
-    with contextlib.closing(db_conn_pool.connect()) as db_conn:
-        for job in fetch_new_search_jobs(db_conn):
-            job_id = str(job["job_id"])
-
-            # Avoid double-dispatch when a job is WAITING_FOR_REDUCER
-            if job_id in active_jobs:
-                continue
-
-            search_config = SearchConfig.parse_obj(msgpack.unpackb(job["job_config"]))
-            archives_for_search = get_archives_for_search(db_conn, search_config)
-            if len(archives_for_search) == 0:
-                if set_job_or_task_status(
-                    db_conn,
-                    QUERY_JOBS_TABLE_NAME,
-                    job_id,
-                    QueryJobStatus.SUCCEEDED,
-                    QueryJobStatus.PENDING,
-                    start_time=datetime.datetime.now(),
-                    num_tasks=0,
-                    duration=0,
-                ):
-                    logger.info(f"No matching archives, skipping job {job['job_id']}.")
-                continue
-
-            new_search_job = SearchJob(
-                id=job_id,
-                search_config=search_config,
-                state=InternalJobState.WAITING_FOR_DISPATCH,
-                num_archives_to_search=len(archives_for_search),
-                num_archives_searched=0,
-                remaining_archives_for_search=archives_for_search,
-            )
-
-            if search_config.aggregation_config is not None:
-                new_search_job.search_config.aggregation_config.job_id = job["job_id"]
-                new_search_job.state = InternalJobState.WAITING_FOR_REDUCER
-                new_search_job.reducer_acquisition_task = asyncio.create_task(
-                    acquire_reducer_for_job(new_search_job)
-                )
-                reducer_acquisition_tasks.append(new_search_job.reducer_acquisition_task)
-            else:
-                pending_jobs.append(new_search_job)
-            active_jobs[job_id] = new_search_job
-
-        for job in pending_jobs:
-            job_id = job.id
-
-            if (
-                job.search_config.network_address is None
-                and len(job.remaining_archives_for_search) > num_archives_to_search_per_sub_job
-            ):
-                archives_for_search = job.remaining_archives_for_search[
-                    :num_archives_to_search_per_sub_job
-                ]
-                job.remaining_archives_for_search = job.remaining_archives_for_search[
-                    num_archives_to_search_per_sub_job:
-                ]
-            else:
-                archives_for_search = job.remaining_archives_for_search
-                job.remaining_archives_for_search = []
-
-            dispatch_search_job(
-                db_conn, job, archives_for_search, clp_metadata_db_conn_params, results_cache_uri
-            )
-            logger.info(
-                f"Dispatched job {job_id} with {len(archives_for_search)} archives to search."
-            )
-            start_time = datetime.datetime.now()
-            job.start_time = start_time
-            set_job_or_task_status(
+    # Archive lists fetched during this poll, keyed by the config fields that affect the lookup.
+    # Jobs submitted in a burst (e.g., by a dashboard) often share the same time range and tags, so
+    # this turns N identical archive-table scans into one.
+    archives_for_search_cache: Dict[Tuple, List[Dict[str, any]]] = {}
+
+    # Each job is claimed exactly once, so every entry of `new_jobs` is genuinely new
+    loop = asyncio.get_running_loop()
+    for job in new_jobs:
+        job_id = str(job["job_id"])
+
+        # Config decoding happens in an executor so large configs don't stall the event loop (and
+        # thus reducer connection handling)
+        search_config = await loop.run_in_executor(None, parse_search_config, job["job_config"])
+        archives_cache_key = (
+            search_config.begin_timestamp,
+            search_config.end_timestamp,
+            tuple(search_config.tags) if search_config.tags is not None else None,
+        )
+        archives_for_search = archives_for_search_cache.get(archives_cache_key)
+        if archives_for_search is None:
+            archives_for_search = get_archives_for_search(db_cursor, search_config)
+            archives_for_search_cache[archives_cache_key] = archives_for_search
+        if len(archives_for_search) == 0:
+            # The job's row was already set to RUNNING when it was claimed
+            if set_job_or_task_status(
                 db_conn,
+                db_cursor,
                 QUERY_JOBS_TABLE_NAME,
                 job_id,
+                QueryJobStatus.SUCCEEDED,
                 QueryJobStatus.RUNNING,
-                QueryJobStatus.PENDING,
-                start_time=start_time,
-                num_tasks=job.num_archives_to_search,
+                start_time=datetime.datetime.now(),
+                num_tasks=0,
+                duration=0,
+            ):
+                logger.info(f"No matching archives, skipping job {job['job_id']}.")
+            continue
+
+        new_search_job = SearchJob(
+            id=job_id,
+            search_config=search_config,
+            state=InternalJobState.WAITING_FOR_DISPATCH,
+            num_archives_to_search=len(archives_for_search),
+            num_archives_searched=0,
+            remaining_archives_for_search=archives_for_search,
+        )
+
+        if search_config.aggregation_config is not None:
+            new_search_job.search_config.aggregation_config.job_id = job["job_id"]
+            new_search_job.state = InternalJobState.WAITING_FOR_REDUCER
+            new_search_job.reducer_acquisition_task = asyncio.create_task(
+                acquire_reducer_for_job(new_search_job)
             )
+            reducer_acquisition_tasks.append(new_search_job.reducer_acquisition_task)
+        else:
+            pending_jobs.append(new_search_job)
+        active_jobs[job_id] = new_search_job
+
+    for job in pending_jobs:
+        job_id = job.id
+
+        if (
+            job.search_config.network_address is None
+            and len(job.remaining_archives_for_search) > num_archives_to_search_per_sub_job
+        ):
+            archives_for_search = job.remaining_archives_for_search[
+                :num_archives_to_search_per_sub_job
+            ]
+            job.remaining_archives_for_search = job.remaining_archives_for_search[
+                num_archives_to_search_per_sub_job:
+            ]
+        else:
+            archives_for_search = job.remaining_archives_for_search
+            job.remaining_archives_for_search = []
+
+        await dispatch_search_job(
+            db_conn,
+            db_cursor,
+            job,
+            archives_for_search,
+            clp_metadata_db_conn_params,
+            results_cache_uri,
+            num_archives_per_search_task,
+        )
+        logger.info(f"Dispatched job {job_id} with {len(archives_for_search)} archives to search.")
+        start_time = datetime.datetime.now()
+        job.start_time = start_time
+        # The job's row was already set to RUNNING when it was claimed; this fills in the
+        # dispatch-time fields
+        set_job_or_task_status(
+            db_conn,
+            db_cursor,
+            QUERY_JOBS_TABLE_NAME,
+            job_id,
+            QueryJobStatus.RUNNING,
+            QueryJobStatus.RUNNING,
+            start_time=start_time,
+            num_tasks=job.num_archives_to_search,
+        )
 
     return reducer_acquisition_tasks
 
 
-def try_getting_task_result(async_task_result):
-    if not async_task_result.ready():
-        return None
-    return async_task_result.get()
-
-
 def found_max_num_latest_results(
     results_cache_uri: str,
     job_id: str,
@@ -490,118 +735,157 @@ def found_max_num_latest_results(
 async def check_job_status_and_update_db(db_conn_pool, results_cache_uri):
     global active_jobs
 
-    with contextlib.closing(db_conn_pool.connect()) as db_conn:
-        for job_id in [
-            id for id, job in active_jobs.items() if InternalJobState.RUNNING == job.state
-        ]:
-            job = active_jobs[job_id]
-            is_reducer_job = job.reducer_handler_msg_queues is not None
+    job_status_updates: List[JobStatusUpdate] = []
+    completion_log_entries: List[Tuple[int, str]] = []
 
-            try:
-                returned_results = try_getting_task_result(job.current_sub_job_async_task_result)
-            except Exception as e:
-                logger.error(f"Job `{job_id}` failed: {e}.")
-                # Clean up
-                if is_reducer_job:
-                    msg = ReducerHandlerMessage(ReducerHandlerMessageType.FAILURE)
-                    await job.reducer_handler_msg_queues.put_to_handler(msg)
-
-                del active_jobs[job_id]
-                set_job_or_task_status(
-                    db_conn,
-                    QUERY_JOBS_TABLE_NAME,
-                    job_id,
-                    QueryJobStatus.FAILED,
-                    QueryJobStatus.RUNNING,
-                    duration=(datetime.datetime.now() - job.start_time).total_seconds(),
+    completed_sub_jobs: List[Tuple[str, Optional[List[any]], Optional[Exception]]] = []
+    while True:
+        try:
+            completed_sub_jobs.append(sub_job_completion_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+    # No sub-jobs completed since the last check, so skip the pool checkout entirely; an idle
+    # scheduler does no database work on this path
+    if 0 == len(completed_sub_jobs):
+        return
+
+    for job_id, returned_results, sub_job_exception in completed_sub_jobs:
+        job = active_jobs.get(job_id)
+        # Skip jobs that are no longer active (e.g., cancelled after their sub-job completed)
+        # or whose completion was already processed
+        if job is None or InternalJobState.RUNNING != job.state:
+            continue
+        is_reducer_job = job.reducer_handler_msg_queues is not None
+
+        if sub_job_exception is not None:
+            logger.error(f"Job `{job_id}` failed: {sub_job_exception}.")
+            # Clean up
+            if is_reducer_job:
+                msg = ReducerHandlerMessage(ReducerHandlerMessageType.FAILURE)
+                await job.reducer_handler_msg_queues.put_to_handler(msg)
+
+            del active_jobs[job_id]
+            job_status_updates.append(
+                JobStatusUpdate(
+                    job_id=job_id,
+                    status=QueryJobStatus.FAILED,
+                    prev_status=QueryJobStatus.RUNNING,
+                    fields={"duration": (datetime.datetime.now() - job.start_time).total_seconds()},
+                )
+            )
+            continue
+
+        new_job_status = QueryJobStatus.RUNNING
+        # Each task searches a bundle of archives and returns one result per archive
+        for task_result_obj in itertools.chain.from_iterable(returned_results):
+            task_result = QueryTaskResult.parse_obj(task_result_obj)
+            task_id = task_result.task_id
+            task_status = task_result.status
+            if not task_status == QueryTaskStatus.SUCCEEDED:
+                new_job_status = QueryJobStatus.FAILED
+                logger.error(
+                    f"Search task job-{job_id}-task-{task_id} failed. "
+                    f"Check {task_result.error_log_path} for details."
+                )
+            else:
+                job.num_archives_searched += 1
+                logger.info(
+                    f"Search task job-{job_id}-task-{task_id} succeeded in "
+                    f"{task_result.duration} second(s)."
                 )
-                continue
-
-            if returned_results is None:
-                continue
-
-            new_job_status = QueryJobStatus.RUNNING
-            for task_result_obj in returned_results:
-                task_result = QueryTaskResult.parse_obj(task_result_obj)
-                task_id = task_result.task_id
-                task_status = task_result.status
-                if not task_status == QueryTaskStatus.SUCCEEDED:
-                    new_job_status = QueryJobStatus.FAILED
-                    logger.error(
-                        f"Search task job-{job_id}-task-{task_id} failed. "
-                        f"Check {task_result.error_log_path} for details."
-                    )
-                else:
-                    job.num_archives_searched += 1
-                    logger.info(
-                        f"Search task job-{job_id}-task-{task_id} succeeded in "
-                        f"{task_result.duration} second(s)."
-                    )
 
-            if new_job_status != QueryJobStatus.FAILED:
-                max_num_results = job.search_config.max_num_results
-                # Check if we've searched all archives
-                if len(job.remaining_archives_for_search) == 0:
-                    new_job_status = QueryJobStatus.SUCCEEDED
-                # Check if we've reached max results
-                elif False == is_reducer_job and max_num_results > 0:
-                    if found_max_num_latest_results(
-                        results_cache_uri,
-                        job_id,
-                        max_num_results,
-                        job.remaining_archives_for_search[0]["end_timestamp"],
-                    ):
-                        new_job_status = QueryJobStatus.SUCCEEDED
-            if new_job_status == QueryJobStatus.RUNNING:
-                job.current_sub_job_async_task_result = None
-                job.state = InternalJobState.WAITING_FOR_DISPATCH
-                logger.info(f"Job {job_id} waiting for more archives to search.")
-                set_job_or_task_status(
-                    db_conn,
-                    QUERY_JOBS_TABLE_NAME,
+        if new_job_status != QueryJobStatus.FAILED:
+            max_num_results = job.search_config.max_num_results
+            # Check if we've searched all archives
+            if len(job.remaining_archives_for_search) == 0:
+                new_job_status = QueryJobStatus.SUCCEEDED
+            # Check if we've reached max results
+            elif False == is_reducer_job and max_num_results > 0:
+                if found_max_num_latest_results(
+                    results_cache_uri,
                     job_id,
-                    QueryJobStatus.RUNNING,
-                    QueryJobStatus.RUNNING,
-                    num_tasks_completed=job.num_archives_searched,
+                    max_num_results,
+                    job.remaining_archives_for_search[0]["end_timestamp"],
+                ):
+                    new_job_status = QueryJobStatus.SUCCEEDED
+        if new_job_status == QueryJobStatus.RUNNING:
+            job.current_sub_job_async_task_result = None
+            job.current_sub_job_awaiter_task = None
+            job.state = InternalJobState.WAITING_FOR_DISPATCH
+            dispatch_wakeup_event.set()
+            logger.info(f"Job {job_id} waiting for more archives to search.")
+            job_status_updates.append(
+                JobStatusUpdate(
+                    job_id=job_id,
+                    status=QueryJobStatus.RUNNING,
+                    prev_status=QueryJobStatus.RUNNING,
+                    fields={"num_tasks_completed": job.num_archives_searched},
                 )
-                continue
-
-            reducer_failed = False
-            if is_reducer_job:
-                # Notify reducer that it should have received all results
-                msg = ReducerHandlerMessage(ReducerHandlerMessageType.SUCCESS)
-                await job.reducer_handler_msg_queues.put_to_handler(msg)
+            )
+            continue
+
+        reducer_failed = False
+        if is_reducer_job:
+            # Notify reducer that it should have received all results
+            msg = ReducerHandlerMessage(ReducerHandlerMessageType.SUCCESS)
+            await job.reducer_handler_msg_queues.put_to_handler(msg)
+
+            msg = await job.reducer_handler_msg_queues.get_from_handler()
+            if ReducerHandlerMessageType.FAILURE == msg.msg_type:
+                reducer_failed = True
+                new_job_status = QueryJobStatus.FAILED
+            elif ReducerHandlerMessageType.SUCCESS != msg.msg_type:
+                error_msg = f"Unexpected msg_type: {msg.msg_type.name}"
+                raise NotImplementedError(error_msg)
 
-                msg = await job.reducer_handler_msg_queues.get_from_handler()
-                if ReducerHandlerMessageType.FAILURE == msg.msg_type:
-                    reducer_failed = True
-                    new_job_status = QueryJobStatus.FAILED
-                elif ReducerHandlerMessageType.SUCCESS != msg.msg_type:
-                    error_msg = f"Unexpected msg_type: {msg.msg_type.name}"
-                    raise NotImplementedError(error_msg)
+        # We set the status regardless of the job's previous status to handle the case where the
+        # job is cancelled (status = CANCELLING) while we're in this method.
+        job_status_updates.append(
+            JobStatusUpdate(
+                job_id=job_id,
+                status=new_job_status,
+                prev_status=None,
+                fields={
+                    "num_tasks_completed": job.num_archives_searched,
+                    "duration": (datetime.datetime.now() - job.start_time).total_seconds(),
+                },
+            )
+        )
+        if new_job_status == QueryJobStatus.SUCCEEDED:
+            completion_log_entries.append((logging.INFO, f"Completed job {job_id}."))
+        elif reducer_failed:
+            completion_log_entries.append(
+                (logging.ERROR, f"Completed job {job_id} with failing reducer.")
+            )
+        else:
+            completion_log_entries.append(
+                (logging.INFO, f"Completed job {job_id} with failing tasks.")
+            )
+        del active_jobs[job_id]
 
-            # We set the status regardless of the job's previous status to handle the case where the
-            # job is cancelled (status = CANCELLING) while we're in this method.
-            if set_job_or_task_status(
-                db_conn,
-                QUERY_JOBS_TABLE_NAME,
-                job_id,
-                new_job_status,
-                num_tasks_completed=job.num_archives_searched,
-                duration=(datetime.datetime.now() - job.start_time).total_seconds(),
-            ):
-                if new_job_status == QueryJobStatus.SUCCEEDED:
-                    logger.info(f"Completed job {job_id}.")
-                elif reducer_failed:
-                    logger.error(f"Completed job {job_id} with failing reducer.")
-                else:
-                    logger.info(f"Completed job {job_id} with failing tasks.")
-            del active_jobs[job_id]
+    # Apply all of this poll's status updates with one statement/commit. The connection is only
+    # checked out for this single write so it isn't held (and kept out of the pool) across the
+    # reducer and result-cache awaits above.
+    with contextlib.closing(db_conn_pool.connect()) as db_conn:
+        num_updated = set_job_statuses_bulk(db_conn, job_status_updates)
+    if num_updated < 0:
+        job_ids = [update.job_id for update in job_status_updates]
+        logger.error(f"Failed to update statuses for jobs {job_ids}.")
+    else:
+        for log_level, log_msg in completion_log_entries:
+            logger.log(log_level, log_msg)
+        if num_updated != len(job_status_updates):
+            # The batched statement can't tell us which rows were left unchanged
+            job_ids = [update.job_id for update in job_status_updates]
+            logger.warning(
+                f"Only {num_updated} of {len(job_status_updates)} status updates were applied"
+                f" (jobs {job_ids}); the rest likely failed their previous-status guard."
+            )
 
 
 async def handle_job_updates(db_conn_pool, results_cache_uri: str, jobs_poll_delay: float):
     while True:
-        await handle_cancelling_search_jobs(db_conn_pool)
         await check_job_status_and_update_db(db_conn_pool, results_cache_uri)
         await asyncio.sleep(jobs_poll_delay)
 
@@ -612,6 +896,7 @@ async def handle_jobs(
     results_cache_uri: str,
     jobs_poll_delay: float,
     num_archives_to_search_per_sub_job: int,
+    num_archives_per_search_task: int,
 ) -> None:
     handle_updating_task = asyncio.create_task(
         handle_job_updates(db_conn_pool, results_cache_uri, jobs_poll_delay)
@@ -619,14 +904,30 @@ async def handle_jobs(
 
     tasks = [handle_updating_task]
     while True:
-        reducer_acquisition_tasks = handle_pending_search_jobs(
-            db_conn_pool,
-            clp_metadata_db_conn_params,
-            results_cache_uri,
-            num_archives_to_search_per_sub_job,
-        )
+        reducer_acquisition_tasks: List[asyncio.Task] = []
+        with contextlib.closing(db_conn_pool.connect()) as db_conn:
+            # Reuse one cursor for all of this poll's statements; the pool has already logged an
+            # error (and handed back a dummy connection) if the database is unreachable, in which
+            # case we skip the poll and retry after the next wakeup.
+            if not isinstance(db_conn, DummyCloseableObject):
+                with contextlib.closing(db_conn.cursor(dictionary=True)) as db_cursor:
+                    cancelling_jobs = fetch_cancelling_search_jobs(db_cursor)
+                    new_jobs = claim_pending_search_jobs(
+                        db_conn, db_cursor, MAX_PENDING_JOBS_PER_POLL
+                    )
+
+                    await handle_cancelling_search_jobs(db_conn, db_cursor, cancelling_jobs)
+                    reducer_acquisition_tasks = await handle_pending_search_jobs(
+                        db_conn,
+                        db_cursor,
+                        new_jobs,
+                        clp_metadata_db_conn_params,
+                        results_cache_uri,
+                        num_archives_to_search_per_sub_job,
+                        num_archives_per_search_task,
+                    )
         if 0 == len(reducer_acquisition_tasks):
-            tasks.append(asyncio.create_task(asyncio.sleep(jobs_poll_delay)))
+            tasks.append(asyncio.create_task(wait_for_dispatch_wakeup(jobs_poll_delay)))
         else:
             tasks.extend(reducer_acquisition_tasks)
 
@@ -642,7 +943,9 @@ async def handle_jobs(
 
 
 async def main(argv: List[str]) -> int:
+    global dispatch_wakeup_event
     global reducer_connection_queue
+    global sub_job_completion_queue
 
     args_parser = argparse.ArgumentParser(description="Wait for and run query jobs.")
     args_parser.add_argument("--config", "-c", required=True, help="CLP configuration file.")
@@ -669,7 +972,9 @@ async def main(argv: List[str]) -> int:
         logger.error(ex)
         return -1
 
+    dispatch_wakeup_event = asyncio.Event()
     reducer_connection_queue = asyncio.Queue(32)
+    sub_job_completion_queue = asyncio.Queue()
 
     sql_adapter = SQL_Adapter(clp_config.database)
 
@@ -697,6 +1002,14 @@ async def main(argv: List[str]) -> int:
             f"Connected to archive database"
             f" {clp_config.database.host}:{clp_config.database.port}."
         )
+
+        # Re-queue any jobs a previous scheduler instance claimed but never dispatched before it
+        # exited
+        with contextlib.closing(db_conn_pool.connect()) as db_conn:
+            if not isinstance(db_conn, DummyCloseableObject):
+                with contextlib.closing(db_conn.cursor(dictionary=True)) as db_cursor:
+                    reset_unstarted_running_jobs(db_conn, db_cursor)
+
         logger.info("Query scheduler started.")
         batch_size = clp_config.query_scheduler.num_archives_to_search_per_sub_job
         job_handler = asyncio.create_task(
@@ -708,6 +1021,9 @@ async def main(argv: List[str]) -> int:
                 results_cache_uri=clp_config.results_cache.get_uri(),
                 jobs_poll_delay=clp_config.query_scheduler.jobs_poll_delay,
                 num_archives_to_search_per_sub_job=batch_size,
+                num_archives_per_search_task=(
+                    clp_config.query_scheduler.num_archives_per_search_task
+                ),
             )
         )
         reducer_handler = asyncio.create_task(reducer_handler.serve_forever())
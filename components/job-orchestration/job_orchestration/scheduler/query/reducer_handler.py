@@ -1,5 +1,6 @@
 import asyncio
 import enum
+import struct
 from enum import Enum
 from typing import Any, Optional
 
@@ -10,6 +11,14 @@ from job_orchestration.scheduler.job_config import AggregationConfig
 # Setup logging
 logger = get_logger("reducer_handler")
 
+# Pre-compiled codec for the 8-byte little-endian length prefix on every reducer message
+_MSG_SIZE_STRUCT = struct.Struct("<Q")
+
+# Reused for all outgoing messages to avoid allocating a fresh packer (and its internal buffer) per
+# message. Safe to share since the event loop runs handlers one at a time and each `pack` call
+# returns a complete, independent bytes object.
+_MSG_PACKER = msgpack.Packer()
+
 
 class ReducerHandlerMessageType(Enum):
     SUCCESS = enum.auto()
@@ -84,8 +93,8 @@ async def _recv_msg_from_reducer(reader: asyncio.StreamReader) -> bytes:
     :param reader: StreamReader connected to a reducer
     :return: The received message
     """
-    msg_size_bytes = await reader.readexactly(8)
-    msg_size = int.from_bytes(msg_size_bytes, byteorder="little")
+    msg_size_bytes = await reader.readexactly(_MSG_SIZE_STRUCT.size)
+    (msg_size,) = _MSG_SIZE_STRUCT.unpack(msg_size_bytes)
     return await reader.readexactly(msg_size)
 
 
@@ -95,7 +104,7 @@ async def _send_msg_to_reducer(msg: bytes, writer: asyncio.StreamWriter):
     :param msg:
     :param writer: StreamWriter connected to a reducer
     """
-    msg_size_bytes = (len(msg)).to_bytes(8, byteorder="little")
+    msg_size_bytes = _MSG_SIZE_STRUCT.pack(len(msg))
     writer.write(msg_size_bytes)
     writer.write(msg)
     await writer.drain()
@@ -106,6 +115,9 @@ async def handle_reducer_connection(
     writer: asyncio.StreamWriter,
     reducer_connection_queue: asyncio.Queue,
 ):
+    msg_queues: Optional[ReducerHandlerMessageQueues] = None
+    recv_listener_msg_task: Optional[asyncio.Task] = None
+    recv_reducer_msg_task: Optional[asyncio.Task] = None
     try:
         message_bytes = await _recv_msg_from_reducer(reader)
         reducer_addr_info = msgpack.unpackb(message_bytes)
@@ -127,10 +139,8 @@ async def handle_reducer_connection(
         # Transition to next state
         """
         current_wait_state: _ReducerHandlerWaitState = _ReducerHandlerWaitState.JOB_CONFIG
-        recv_listener_msg_task: Optional[asyncio.Task] = asyncio.create_task(
-            msg_queues.get_from_listeners()
-        )
-        recv_reducer_msg_task: Optional[asyncio.Task] = asyncio.create_task(reader.readexactly(1))
+        recv_listener_msg_task = asyncio.create_task(msg_queues.get_from_listeners())
+        recv_reducer_msg_task = asyncio.create_task(reader.readexactly(1))
         while True:
             pending = [recv_listener_msg_task, recv_reducer_msg_task]
             done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
@@ -147,11 +157,12 @@ async def handle_reducer_connection(
                     await _handle_unexpected_msg_from_listener(
                         current_wait_state, msg.msg_type, msg_queues
                     )
+                    return
                 aggregation_config: AggregationConfig = msg.payload
                 job_id = aggregation_config.job_id
                 time_bucket_size = aggregation_config.count_by_time_bucket_size
                 await _send_msg_to_reducer(
-                    msgpack.packb(
+                    _MSG_PACKER.pack(
                         {
                             "job_id": job_id,
                             "count_by_time_bucket_size": time_bucket_size,
@@ -174,6 +185,9 @@ async def handle_reducer_connection(
                         )
                         return
 
+                # Raises if the connection failed rather than the reducer ACKing the job
+                recv_reducer_msg_task.result()
+
                 # Tell the listener the reducer ACKed the job
                 msg = ReducerHandlerMessage(ReducerHandlerMessageType.SUCCESS)
                 await msg_queues.put_to_listeners(msg)
@@ -196,7 +210,7 @@ async def handle_reducer_connection(
                     return
 
                 # Tell the reducer the query workers are done
-                await _send_msg_to_reducer(msgpack.packb({"done": True}), writer)
+                await _send_msg_to_reducer(_MSG_PACKER.pack({"done": True}), writer)
 
                 recv_listener_msg_task = asyncio.create_task(msg_queues.get_from_listeners())
                 current_wait_state = _ReducerHandlerWaitState.REDUCER_DONE
@@ -212,9 +226,25 @@ async def handle_reducer_connection(
                         )
                         return
 
+                # Raises if the connection failed rather than the reducer signalling it's done
+                recv_reducer_msg_task.result()
+
                 msg = ReducerHandlerMessage(ReducerHandlerMessageType.SUCCESS)
                 await msg_queues.put_to_listeners(msg)
                 break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        logger.error("Reducer connection failed.")
+        if msg_queues is not None:
+            # The reducer's connection info may already be (or have been) handed to a job through
+            # `reducer_connection_queue`, so queue a FAILURE for whichever job picks it up so that
+            # the job retries with another reducer instead of waiting on this one forever.
+            msg = ReducerHandlerMessage(ReducerHandlerMessageType.FAILURE)
+            await msg_queues.put_to_listeners(msg)
     finally:
+        # Cancel whichever of the two read tasks is still outstanding so exiting in any state
+        # doesn't leak a task (or leave a stale getter on the listener queue)
+        for task in (recv_listener_msg_task, recv_reducer_msg_task):
+            if task is not None and not task.done():
+                task.cancel()
         writer.close()
         await writer.wait_closed()
@@ -3,7 +3,11 @@ import datetime
 from enum import auto, Enum
 from typing import Any, Dict, List, Optional
 
-from job_orchestration.scheduler.constants import CompressionTaskStatus, QueryTaskStatus
+from job_orchestration.scheduler.constants import (
+    CompressionTaskStatus,
+    QueryJobStatus,
+    QueryTaskStatus,
+)
 from job_orchestration.scheduler.job_config import SearchConfig
 from job_orchestration.scheduler.query.reducer_handler import ReducerHandlerMessageQueues
 from pydantic import BaseModel, validator
@@ -40,10 +44,14 @@ class QueryJob(BaseModel):
     state: InternalJobState
     start_time: Optional[datetime.datetime]
     current_sub_job_async_task_result: Optional[Any]
+    current_sub_job_awaiter_task: Optional[Any]
 
 
 class SearchJob(QueryJob):
     search_config: SearchConfig
+    # `search_config.dict()`, computed on the job's first dispatch (i.e., after any reducer has
+    # been assigned) and reused for every subsequent sub-job
+    cached_search_config_obj: Optional[Dict[str, Any]]
     num_archives_to_search: int
     num_archives_searched: int
     remaining_archives_for_search: List[Dict[str, Any]]
@@ -54,6 +62,13 @@ class SearchJob(QueryJob):
         arbitrary_types_allowed = True
 
 
+class JobStatusUpdate(BaseModel):
+    job_id: str
+    status: QueryJobStatus
+    prev_status: Optional[QueryJobStatus]
+    fields: Dict[str, Any] = {}
+
+
 class QueryTaskResult(BaseModel):
     status: QueryTaskStatus
     task_id: str